@@ -1,7 +1,14 @@
 import os
 import asyncio
+import logging
+import random
+import re
+from functools import lru_cache
+from pathlib import PurePosixPath
 from typing import Any, Dict, List, Optional, cast
 import daft
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from application_sdk.activities.metadata_extraction.base import (
     BaseMetadataExtractionActivities,
@@ -30,6 +37,98 @@ from application_sdk.observability.logger_adaptor import get_logger
 logger = get_logger(__name__)
 activity.logger = logger
 
+# Size Arrow's internal thread pool to the host so parquet column encoding
+# and decoding run in parallel across cores for wide tables.
+pa.set_cpu_count(os.cpu_count() or 4)
+
+# In-process handoff of the raw Arrow table from fetch_repositories to
+# transform_data, keyed by workflow_run_id. When both activities land on the
+# same worker this skips one parquet encode/decode cycle; the file on disk
+# remains the fallback for cross-worker scheduling. Deliberately single-slot:
+# inserts evict whatever a failed, cancelled, or cross-worker run left
+# behind, so at most one dataset is ever pinned in worker memory.
+_raw_table_cache: Dict[str, pa.Table] = {}
+
+# get_object_store_prefix is a pure function of the path and is computed in
+# multiple activities for the same output_path, so memoize it.
+_object_store_prefix = lru_cache(maxsize=128)(get_object_store_prefix)
+
+# Matches the "not found" StateStore error raised before the workflow config
+# file lands; precompiled so retry classification doesn't re-scan per attempt.
+_NOT_FOUND_RE = re.compile(r"not found", re.IGNORECASE)
+
+# Fixed Arrow schema for the flattened repository table, covering the subset
+# of GitHub's ~100 repo fields the transformer actually consumes. Declaring it
+# once skips per-page schema inference and guarantees a stable parquet schema
+# across runs even when sampled values are all null.
+REPOSITORY_SCHEMA = pa.schema(
+    [
+        ("id", pa.int64()),
+        ("name", pa.string()),
+        ("full_name", pa.string()),
+        ("description", pa.string()),
+        ("html_url", pa.string()),
+        ("default_branch", pa.string()),
+        ("private", pa.bool_()),
+        ("fork", pa.bool_()),
+        ("stargazers_count", pa.int64()),
+        ("watchers_count", pa.int64()),
+        ("forks_count", pa.int64()),
+        ("open_issues_count", pa.int64()),
+        ("language", pa.string()),
+        ("owner_login", pa.string()),
+    ]
+)
+
+TRANSFORM_COLUMNS = tuple(REPOSITORY_SCHEMA.names)
+
+# Target parquet row-group size; each ParquetWriter.write_table call closes
+# its row groups, so pages are buffered up to this many rows before writing.
+_RAW_ROW_GROUP_SIZE = 64000
+
+# Schema fields copied straight off the raw repo dict (everything except the
+# flattened owner_login).
+_SCALAR_COLUMNS = tuple(name for name in TRANSFORM_COLUMNS if name != "owner_login")
+
+
+def _flatten_repositories(repos: List[Dict[str, Any]]) -> pa.Table:
+    """
+    Converts a page of raw repository dicts into an Arrow table matching
+    REPOSITORY_SCHEMA, flattening the nested 'owner' struct into an
+    owner_login column. Only the schema's fields are picked off each dict,
+    so the dozens of unused (often deeply nested) GitHub fields never reach
+    the Arrow conversion at all.
+    """
+    rows = [
+        {
+            **{name: repo.get(name) for name in _SCALAR_COLUMNS},
+            "owner_login": (repo.get("owner") or {}).get("login"),
+        }
+        for repo in repos
+    ]
+    return pa.Table.from_pylist(rows, schema=REPOSITORY_SCHEMA)
+
+
+def _read_projected_parquet(path: str) -> pa.Table:
+    """
+    Reads a parquet file restricted to the transformer's columns, so parquet
+    column pruning skips any fields a foreign writer may have added.
+    """
+    parquet_file = pq.ParquetFile(path)
+    columns = [c for c in TRANSFORM_COLUMNS if c in parquet_file.schema_arrow.names]
+    return parquet_file.read(columns=columns or None)
+
+
+def _iter_projected_batches(path: str, batch_size: int = 8192):
+    """
+    Yields record batches from a parquet file restricted to the transformer's
+    columns, so callers can process large files one batch at a time instead
+    of materializing the whole table.
+    """
+    parquet_file = pq.ParquetFile(path)
+    columns = [c for c in TRANSFORM_COLUMNS if c in parquet_file.schema_arrow.names]
+    yield from parquet_file.iter_batches(batch_size=batch_size, columns=columns or None)
+
 
 class SourceSenseActivities(BaseMetadataExtractionActivities):
     """
@@ -43,6 +142,22 @@ class SourceSenseActivities(BaseMetadataExtractionActivities):
             transformer_class=GitHubTransformer,
         )
 
+    async def _clean_state(self):
+        """
+        Extends the SDK cleanup to close the GitHub client's connection
+        pool before the state entry for this workflow is dropped.
+        """
+        try:
+            workflow_id = get_workflow_id()
+            state = self._state.get(workflow_id)
+            client = getattr(state, "client", None) if state else None
+            if isinstance(client, GitHubClient):
+                await client.aclose()
+        except Exception as e:
+            # Mirror the base class: cleanup failures are logged, never raised.
+            logger.warning(f"Failed to close GitHub client during cleanup: {e}")
+        await super()._clean_state()
+
     @activity.defn
     async def get_workflow_args(
         self, workflow_config: Dict[str, Any]
@@ -55,15 +170,14 @@ class SourceSenseActivities(BaseMetadataExtractionActivities):
             raise ValueError("workflow_id is required in workflow_config")
 
         max_retries = 5
-        retry_delay_seconds = 2
 
         for attempt in range(max_retries):
             try:
                 workflow_args = await StateStore.get_state(workflow_id, StateType.WORKFLOWS)
                 
                 workflow_args["output_prefix"] = workflow_args.get("output_prefix", TEMPORARY_PATH)
-                workflow_args["output_path"] = os.path.join(
-                    workflow_args["output_prefix"], build_output_path()
+                workflow_args["output_path"] = str(
+                    PurePosixPath(workflow_args["output_prefix"]) / build_output_path()
                 )
                 workflow_args["workflow_id"] = workflow_id
                 workflow_args["workflow_run_id"] = get_workflow_run_id()
@@ -71,12 +185,22 @@ class SourceSenseActivities(BaseMetadataExtractionActivities):
                 return workflow_args
             
             except Exception as e:
-                if "not found" in str(e).lower():
+                # Classify by exception type first; the regex is only the
+                # fallback for SDK errors that bury "not found" in their
+                # message. Anything else aborts immediately without sleeping.
+                retriable = isinstance(e, (FileNotFoundError, KeyError)) or bool(
+                    _NOT_FOUND_RE.search(str(e))
+                )
+                if retriable:
                     logger.warning(
                         f"Config file not yet available on attempt {attempt + 1}/{max_retries}. Retrying..."
                     )
                     if attempt < max_retries - 1:
-                        await asyncio.sleep(retry_delay_seconds)
+                        # Exponential backoff with jitter: most races resolve
+                        # within a few hundred ms, so start small instead of
+                        # paying a fixed 2s on every cold start.
+                        delay = min(8.0, 0.2 * (2 ** attempt)) + random.uniform(0, 0.1)
+                        await asyncio.sleep(delay)
                     else:
                         logger.error("Failed to retrieve workflow arguments after all retries.")
                         raise
@@ -98,111 +222,109 @@ class SourceSenseActivities(BaseMetadataExtractionActivities):
         if not handler:
             raise ValueError("Handler is not initialized in the activity state.")
 
-        # --- START FIX: Add cleanup step ---
-        # Manually clean up the output directory from any previous runs to prevent conflicts.
-        import shutil
         output_path = workflow_args.get("output_path")
-        if output_path and os.path.exists(output_path):
-            shutil.rmtree(output_path)
-            logger.info(f"Cleaned up previous run data from: {output_path}")
-        # --- END FIX ---
-        
-        raw_data_list: List[Dict[str, Any]] = await handler.fetch_repositories_metadata(
-            owner=workflow_args.get("metadata", {}).get("owner")
+        if not output_path:
+            raise ValueError("output_path is required in workflow_args")
+
+        # Route output into a run-scoped subdirectory so retried or
+        # concurrent runs never collide. This replaces the upfront rmtree
+        # sweep of the whole output path; stale run directories are left to
+        # background cleanup.
+        run_id = workflow_args.get("workflow_run_id") or get_workflow_run_id()
+        local_raw_data_path = str(
+            PurePosixPath(output_path) / (run_id or "") / "raw" / "REPOSITORY"
         )
+        await asyncio.to_thread(os.makedirs, local_raw_data_path, exist_ok=True)
 
-        if not raw_data_list:
-            logger.warning("No repositories found, skipping file write.")
-            return None
+        try:
+            # Use a specific file path instead of root_dir to ensure files are written
+            parquet_file_path = str(
+                PurePosixPath(local_raw_data_path) / "repositories.parquet"
+            )
 
-        logger.info(f"Processing {len(raw_data_list)} repositories")
+            # Stream pages straight into the parquet file as they arrive, so
+            # peak memory stays at one page of repos (plus the Arrow batches,
+            # which are kept for the in-process handoff to transform_data).
+            writer: Optional[pq.ParquetWriter] = None
+            page_tables: List[pa.Table] = []
+            # Pages are ~100 rows and each write_table call closes its row
+            # groups, so pages are buffered until the row-group target
+            # accumulates and flushed as one write.
+            pending_tables: List[pa.Table] = []
+            pending_rows = 0
+            row_count = 0
+            try:
+                async for page in handler.iter_repository_pages(
+                    owner=workflow_args.get("metadata", {}).get("owner")
+                ):
+                    page_table = _flatten_repositories(page)
+                    if page_table.num_rows == 0:
+                        continue
+                    if writer is None:
+                        logger.info(f"Writing parquet file to: {parquet_file_path}")
+                        writer = pq.ParquetWriter(
+                            parquet_file_path,
+                            REPOSITORY_SCHEMA,
+                            compression="zstd",
+                            compression_level=3,
+                            use_dictionary=True,
+                            write_statistics=True,
+                            data_page_size=1 << 20,
+                        )
+                    pending_tables.append(page_table)
+                    pending_rows += page_table.num_rows
+                    if pending_rows >= _RAW_ROW_GROUP_SIZE:
+                        await asyncio.to_thread(
+                            writer.write_table,
+                            pa.concat_tables(pending_tables),
+                            row_group_size=_RAW_ROW_GROUP_SIZE,
+                        )
+                        pending_tables = []
+                        pending_rows = 0
+                    page_tables.append(page_table)
+                    row_count += page_table.num_rows
+                    # Let Temporal know the activity is alive (and make it
+                    # cancellable) while long page fetches are in flight.
+                    activity.heartbeat(row_count)
+
+                if writer is not None and pending_tables:
+                    await asyncio.to_thread(
+                        writer.write_table,
+                        pa.concat_tables(pending_tables),
+                        row_group_size=_RAW_ROW_GROUP_SIZE,
+                    )
+            finally:
+                if writer is not None:
+                    await asyncio.to_thread(writer.close)
+
+            if row_count == 0:
+                logger.warning("No repositories found, skipping file write.")
+                return None
 
-        flattened_data: List[Dict[str, Any]] = []
-        for i, repo in enumerate(raw_data_list):
-            flat_repo = repo.copy()
-            if 'owner' in flat_repo and isinstance(flat_repo['owner'], dict):
-                owner_dict = flat_repo['owner']
-                flat_repo['owner_login'] = owner_dict['login'] if 'login' in owner_dict else None
-                del flat_repo['owner']
+            logger.info(f"Fetched and wrote {row_count} repositories")
+
+            # Verify the file was written successfully
+            if os.path.exists(parquet_file_path):
+                file_size = await asyncio.to_thread(os.path.getsize, parquet_file_path)
+                logger.info(f"Successfully wrote parquet file, size: {file_size} bytes")
+
+                if file_size == 0:
+                    raise ValueError("Parquet file was written but has 0 bytes")
             else:
-                flat_repo['owner_login'] = None
-                if 'owner' in flat_repo:
-                    del flat_repo['owner']
-            flattened_data.append(flat_repo)
-            
-            # Debug: log first few items
-            if i < 3:
-                logger.info(f"Processed repo {i}: {flat_repo.get('name', 'unnamed')} with keys: {list(flat_repo.keys())}")
-        
-        logger.info(f"Flattened {len(flattened_data)} repositories")
+                raise FileNotFoundError(f"Parquet file was not created at {parquet_file_path}")
 
-        raw_dataframe = daft.from_pylist(flattened_data)
-        
-        # Debug: Check if dataframe has data
-        logger.info(f"Created dataframe with {raw_dataframe.count_rows()} rows and {len(raw_dataframe.columns)} columns")
-        logger.info(f"DataFrame columns: {raw_dataframe.columns}")
-        
-        if not output_path:
-            raise ValueError("output_path is required in workflow_args")
-        
-        local_raw_data_path = os.path.join(output_path, "raw", "REPOSITORY")
-        os.makedirs(local_raw_data_path, exist_ok=True)
+            if run_id:
+                # Evict any stale entry first (single-slot cache); then the
+                # zero-copy concat just references the page batches.
+                _raw_table_cache.clear()
+                _raw_table_cache[run_id] = pa.concat_tables(page_tables)
 
-        try:
-            # Use a specific file path instead of root_dir to ensure files are written
-            parquet_file_path = os.path.join(local_raw_data_path, "repositories.parquet")
-            logger.info(f"About to write parquet file to: {parquet_file_path}")
-            logger.info(f"Dataframe type: {type(raw_dataframe)}, has {raw_dataframe.count_rows()} rows")
-            
-            # Skip Daft write completely and use pandas directly for Windows compatibility
-            try:
-                logger.info("Using pandas approach directly to avoid Windows file locking issues")
-                
-                # Convert Daft dataframe to pandas
-                materialized_df = raw_dataframe.collect()
-                pandas_df = materialized_df.to_pandas()
-                
-                # Write using pandas
-                pandas_df.to_parquet(parquet_file_path, engine='pyarrow')
-                
-                # Verify the file was written successfully
-                if os.path.exists(parquet_file_path):
-                    file_size = os.path.getsize(parquet_file_path)
-                    logger.info(f"Successfully wrote parquet file, size: {file_size} bytes")
-                    
-                    if file_size == 0:
-                        raise ValueError("Parquet file was written but has 0 bytes")
-                else:
-                    raise FileNotFoundError(f"Parquet file was not created at {parquet_file_path}")
-                    
-            except Exception as write_error:
-                logger.error(f"Failed to write parquet with pandas: {write_error}")
-                
-                # Last resort: try different file path in case of path issues
-                logger.info("Attempting alternative file path approach")
-                
-                alternative_path = os.path.join(local_raw_data_path, f"repositories_{get_workflow_run_id()}.parquet")
-                logger.info(f"Trying alternative path: {alternative_path}")
-                
-                # Ensure we have fresh dataframe conversion
-                materialized_df = raw_dataframe.collect()
-                pandas_df = materialized_df.to_pandas()
-                pandas_df.to_parquet(alternative_path, engine='pyarrow')
-                
-                if os.path.exists(alternative_path):
-                    final_size = os.path.getsize(alternative_path)
-                    logger.info(f"Successfully wrote parquet using alternative path, size: {final_size} bytes")
-                    # Update the path for later use
-                    parquet_file_path = alternative_path
-                else:
-                    raise Exception("Failed to write parquet file with any approach")
-            
             stats = ActivityStatistics(
-                total_record_count=raw_dataframe.count_rows(),
+                total_record_count=row_count,
                 chunk_count=1,
                 typename="REPOSITORY",
             )
-            
+
             return {"stats": stats, "local_path": local_raw_data_path}
 
         except Exception as e:
@@ -221,95 +343,187 @@ class SourceSenseActivities(BaseMetadataExtractionActivities):
             raise ValueError("Transformer is not initialized in the activity state.")
 
         try: # --- START CHANGE: Add try block to reveal hidden errors ---
+            # Fast path: reuse the Arrow table fetched in this process, if the
+            # fetch activity ran on the same worker.
+            run_id = workflow_args.get("workflow_run_id") or get_workflow_run_id()
+            cached_table = _raw_table_cache.pop(run_id, None) if run_id else None
+            if cached_table is not None:
+                logger.info(f"Reusing in-process raw data for run: {run_id}")
+                raw_dataframe = daft.from_arrow(cached_table)
+                return await self._transform_and_write(
+                    state.transformer, raw_dataframe, workflow_args
+                )
+
             local_parquet_path = workflow_args.get("local_parquet_path")
             if not local_parquet_path:
                 raise ValueError("Local Parquet path was not provided to transform_data.")
 
             logger.info(f"Reading raw data directly from local path: {local_parquet_path}")
-            
-            # Check what files exist in the directory for debugging
-            if os.path.exists(local_parquet_path):
-                files_in_dir = os.listdir(local_parquet_path)
-                logger.info(f"Files in directory {local_parquet_path}: {files_in_dir}")
-            else:
+
+            if not os.path.exists(local_parquet_path):
                 raise FileNotFoundError(f"Directory {local_parquet_path} does not exist")
-            
+            if logger.isEnabledFor(logging.DEBUG):
+                files_in_dir = [entry.name for entry in os.scandir(local_parquet_path)]
+                logger.debug(f"Files in directory {local_parquet_path}: {files_in_dir}")
+
             # Look for the specific parquet file we created
-            import glob
-            parquet_file_path = os.path.join(local_parquet_path, "repositories.parquet")
-            if os.path.exists(parquet_file_path):
+            parquet_file_path = str(
+                PurePosixPath(local_parquet_path) / "repositories.parquet"
+            )
+            if os.path.isfile(parquet_file_path):
                 logger.info(f"Found specific parquet file: {parquet_file_path}")
-                raw_dataframe = daft.read_parquet(parquet_file_path)
+                # Stream the file batch by batch: each batch is transformed
+                # and its (much smaller) entity table retained, so peak raw
+                # memory is one decoded batch instead of the whole dataset.
+                transformed_tables: List[pa.Table] = []
+                for batch in _iter_projected_batches(parquet_file_path):
+                    batch_dataframe = daft.from_arrow(pa.Table.from_batches([batch]))
+                    transformed = self._transform_dataframe(
+                        state.transformer, batch_dataframe, workflow_args
+                    )
+                    if transformed is not None:
+                        transformed_tables.append(transformed.to_arrow())
+
+                if not transformed_tables:
+                    logger.warning("Transformation resulted in an empty dataframe.")
+                    return None
+
+                transformed_dataframe = daft.from_arrow(
+                    pa.concat_tables(transformed_tables)
+                )
+                return await self._write_transformed(
+                    transformed_dataframe, workflow_args
+                )
             else:
-                # Fallback: try to find any parquet files
-                recursive_pattern = os.path.join(local_parquet_path, "**", "*.parquet")
-                parquet_files = glob.glob(recursive_pattern, recursive=True)
-                logger.info(f"Found parquet files with recursive search: {parquet_files}")
-                
+                # Fallback: pick up any parquet files in the directory. The
+                # writer only ever emits at the directory root, so a flat
+                # scandir replaces the old recursive glob walk.
+                parquet_files = [
+                    entry.path
+                    for entry in os.scandir(local_parquet_path)
+                    if entry.is_file() and entry.name.endswith(".parquet")
+                ]
+                logger.info(f"Found parquet files: {parquet_files}")
+
                 if not parquet_files:
                     raise FileNotFoundError(f"No parquet files found in {local_parquet_path}")
-                
+
                 # Read the files
-                raw_dataframe = daft.read_parquet(parquet_files)
+                raw_table = pa.concat_tables(
+                    [
+                        await asyncio.to_thread(_read_projected_parquet, f)
+                        for f in parquet_files
+                    ]
+                )
 
-            # Check if dataframe is empty using count_rows for unmaterialized dataframes
-            if raw_dataframe.count_rows() == 0:
-                logger.warning("Raw data dataframe is empty, skipping transformation.")
-                return None
-            
-            output_path = workflow_args.get("output_path")
-            output_prefix = workflow_args.get("output_prefix")
+            raw_dataframe = daft.from_arrow(raw_table)
 
-            # Extract workflow args to avoid duplicate keyword arguments
-            # Ensure connection fields have default values to prevent None errors
-            connection_name = workflow_args.get("connection_name") or "github-default"
-            connection_qualified_name = workflow_args.get("connection_qualified_name") or "default/github/connection"
-            
-            transform_kwargs = {
-                "typename": "REPOSITORY",
-                "dataframe": raw_dataframe,
-                "workflow_id": workflow_args.get("workflow_id", ""),
-                "workflow_run_id": workflow_args.get("workflow_run_id", ""),
-                "connection": {
-                    "connection_name": connection_name,
-                    "connection_qualified_name": connection_qualified_name
-                }
+            return await self._transform_and_write(
+                state.transformer, raw_dataframe, workflow_args
+            )
+
+        except Exception as e: # --- START CHANGE: Add except block to log the error ---
+            logger.error(f"An error occurred during the transform_data activity: {e}", exc_info=True)
+            raise # Re-raise the exception so the activity still fails
+
+    async def _transform_and_write(
+        self,
+        transformer: GitHubTransformer,
+        raw_dataframe: daft.DataFrame,
+        workflow_args: Dict[str, Any],
+    ) -> Optional[ActivityStatistics]:
+        """
+        Transforms the raw dataframe and writes the resulting JSON entities
+        back to the object store. Used by the read paths that materialize the
+        whole raw table at once; the streaming path calls the two halves
+        directly.
+        """
+        # Check if dataframe is empty using count_rows for unmaterialized dataframes
+        if raw_dataframe.count_rows() == 0:
+            logger.warning("Raw data dataframe is empty, skipping transformation.")
+            return None
+
+        transformed_dataframe = self._transform_dataframe(
+            transformer, raw_dataframe, workflow_args
+        )
+
+        if transformed_dataframe is None or transformed_dataframe.count_rows() == 0:
+            logger.warning("Transformation resulted in an empty dataframe.")
+            return None
+
+        return await self._write_transformed(transformed_dataframe, workflow_args)
+
+    def _transform_dataframe(
+        self,
+        transformer: GitHubTransformer,
+        raw_dataframe: daft.DataFrame,
+        workflow_args: Dict[str, Any],
+    ) -> Optional[daft.DataFrame]:
+        """
+        Runs the transformer over one raw dataframe, filling in the connection
+        defaults the transformer expects.
+        """
+        # Extract workflow args to avoid duplicate keyword arguments
+        # Ensure connection fields have default values to prevent None errors
+        connection_name = workflow_args.get("connection_name") or "github-default"
+        connection_qualified_name = workflow_args.get("connection_qualified_name") or "default/github/connection"
+
+        transform_kwargs = {
+            "typename": "REPOSITORY",
+            "dataframe": raw_dataframe,
+            "workflow_id": workflow_args.get("workflow_id", ""),
+            "workflow_run_id": workflow_args.get("workflow_run_id", ""),
+            "connection": {
+                "connection_name": connection_name,
+                "connection_qualified_name": connection_qualified_name
             }
+        }
 
-            transformed_dataframe = state.transformer.transform_metadata(**transform_kwargs)
+        return transformer.transform_metadata(**transform_kwargs)
 
-            if not transformed_dataframe or transformed_dataframe.count_rows() == 0:
-                logger.warning("Transformation resulted in an empty dataframe.")
-                return None
+    async def _write_transformed(
+        self,
+        transformed_dataframe: daft.DataFrame,
+        workflow_args: Dict[str, Any],
+    ) -> Optional[ActivityStatistics]:
+        """
+        Writes the transformed entities as JSON back to the object store and
+        returns the output statistics.
+        """
+        output_path = workflow_args.get("output_path")
+        output_prefix = workflow_args.get("output_prefix")
 
-            transformed_output = JsonOutput(
-                output_prefix=output_prefix,
-                output_path=output_path,
-                output_suffix="transformed",
-                typename="REPOSITORY",
-            )
+        transformed_output = JsonOutput(
+            output_prefix=output_prefix,
+            output_path=output_path,
+            output_suffix="transformed",
+            typename="REPOSITORY",
+        )
 
-            logger.info(f"About to write transformed data with output_prefix: {output_prefix}, output_path: {output_path}")
-            await transformed_output.write_daft_dataframe(transformed_dataframe)
-            
-            # Add debugging to check what files were actually created
-            if output_path:
-                local_json_files = glob.glob(os.path.join(output_path, "**", "*.json"), recursive=True)
-                logger.info(f"Local JSON files created: {local_json_files}")
-                
-                # Check object store path
-                object_store_prefix = get_object_store_prefix(output_path)
-                logger.info(f"Object store prefix should be: {object_store_prefix}")
-            else:
-                logger.warning("output_path is None, cannot check created files")
-            
-            logger.info(f"Successfully wrote transformed data to object store")
-            return await transformed_output.get_statistics()
+        logger.info(f"About to write transformed data with output_prefix: {output_prefix}, output_path: {output_path}")
+        await transformed_output.write_daft_dataframe(transformed_dataframe)
+
+        # Add debugging to check what files were actually created; the
+        # directory walk only runs when debug logging is on.
+        if output_path:
+            if logger.isEnabledFor(logging.DEBUG):
+                local_json_files = [
+                    os.path.join(root, file_name)
+                    for root, _, file_names in os.walk(output_path)
+                    for file_name in file_names
+                    if file_name.endswith(".json")
+                ]
+                logger.debug(f"Local JSON files created: {local_json_files}")
+
+            # Check object store path
+            object_store_prefix = _object_store_prefix(output_path)
+            logger.info(f"Object store prefix should be: {object_store_prefix}")
+        else:
+            logger.warning("output_path is None, cannot check created files")
+
+        logger.info(f"Successfully wrote transformed data to object store")
+        return await transformed_output.get_statistics()
 
-        except Exception as e: # --- START CHANGE: Add except block to log the error ---
-            logger.error(f"An error occurred during the transform_data activity: {e}", exc_info=True)
-            raise # Re-raise the exception so the activity still fails
-    
     @activity.defn
     async def upload_to_atlan(
         self, workflow_args: Dict[str, Any]
@@ -318,19 +532,21 @@ class SourceSenseActivities(BaseMetadataExtractionActivities):
         Uploads the transformed data from the object store to Atlan.
         """
         output_path = workflow_args["output_path"]
-        
+
         # The JsonOutput uses get_object_store_prefix to determine where files are uploaded
-        from application_sdk.activities.common.utils import get_object_store_prefix
-        
         if output_path:
-            migration_prefix = get_object_store_prefix(output_path)
+            migration_prefix = _object_store_prefix(output_path)
             logger.info(f"Starting migration from object store with prefix: {migration_prefix}")
             logger.info(f"Original output_path was: {output_path}")
         else:
             logger.error("output_path is None in upload_to_atlan")
             raise ValueError("output_path is required for upload_to_atlan")
         
+        # Heartbeat around the migration so a slow upload doesn't trip the
+        # activity timeout; the SDK call itself is a single opaque await.
+        activity.heartbeat("migration-started")
         upload_stats = await AtlanStorage.migrate_from_objectstore_to_atlan(prefix=migration_prefix)
+        activity.heartbeat(upload_stats.migrated_files)
 
         logger.info(
             f"Atlan upload completed: {upload_stats.migrated_files} files uploaded, "
@@ -1,4 +1,7 @@
-from typing import Any, Dict, List, Optional
+import asyncio
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 import httpx
 
 from application_sdk.clients.base import BaseClient
@@ -12,23 +15,144 @@ class GitHubClient(BaseClient):
     Client to interact with the GitHub API, handling authentication and requests.
     """
     BASE_URL = "https://api.github.com"
+    # Bounded fan-out for paginated endpoints, kept well below GitHub's
+    # secondary rate limits.
+    MAX_CONCURRENT_PAGE_REQUESTS = 10
+    # How long auth/owner check results stay valid in the in-process cache.
+    CHECK_CACHE_TTL_SECONDS = 60.0
+
+    _client: Optional[httpx.AsyncClient] = None
+    # Class-level defaults so calls on an unloaded client reach _get and
+    # fail with its deliberate "client is not loaded" ValueError rather
+    # than an AttributeError; load() re-initializes both per instance.
+    _auth_cache: Optional[Tuple[float, bool]] = None
+    _owner_cache: Dict[str, Tuple[float, bool]] = {}
 
     async def load(self, **kwargs: Any) -> None:
         """
-        Loads credentials and sets up authentication headers for GitHub API requests.
-        The personal access token is expected in the 'token' key of the credentials.
+        Loads credentials and sets up a persistent HTTP/2 client for GitHub
+        API requests. The personal access token is expected in the 'token'
+        key of the credentials.
         """
         credentials = kwargs.get("credentials", {})
         auth_token = credentials.get("token")
         if not auth_token:
             raise ValueError("GitHub personal access token is required in credentials.")
 
-        self.http_headers = {
-            "Authorization": f"Bearer {auth_token}",
-            "Accept": "application/vnd.github.v3+json",
-        }
+        # The SDK server re-invokes load() on every /auth and /check call;
+        # close any previous pool before building a new one so reloads do
+        # not leak keep-alive connections.
+        if self._client is not None:
+            await self.aclose()
+
+        # One long-lived pooled client amortizes the TCP/TLS handshake across
+        # all requests, and HTTP/2 multiplexes the concurrent page fetches.
+        # The headers live on the pool, so no per-request dict is allocated.
+        self._client = httpx.AsyncClient(
+            headers={
+                "Authorization": f"Bearer {auth_token}",
+                "Accept": "application/vnd.github+json",
+                "X-GitHub-Api-Version": "2022-11-28",
+            },
+            http2=True,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+            timeout=30.0,
+        )
+        # Short-lived memos for auth/owner probes; the server's /auth and
+        # /check endpoints can hit the same owner and token repeatedly.
+        self._owner_cache: Dict[str, Tuple[float, bool]] = {}
+        self._auth_cache: Optional[Tuple[float, bool]] = None
         logger.info("GitHub client loaded with authentication headers.")
 
+    async def aclose(self) -> None:
+        """
+        Closes the underlying HTTP client and its connection pool.
+        """
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _get(self, url: str) -> Optional[httpx.Response]:
+        """
+        Issues a GET on the persistent client, returning None on transport
+        errors so call sites can keep their existing status handling.
+        """
+        if self._client is None:
+            raise ValueError("GitHub client is not loaded; call load() first.")
+        try:
+            return await self._client.get(url)
+        except httpx.HTTPError as e:
+            logger.error(f"Request to {url} failed: {e}")
+            return None
+
+    @staticmethod
+    def _url_for_page(url: str, page: int) -> str:
+        """
+        Returns the given URL with its 'page' query parameter set.
+        """
+        parts = urlparse(url)
+        query = parse_qs(parts.query)
+        query["page"] = [str(page)]
+        return urlunparse(parts._replace(query=urlencode(query, doseq=True)))
+
+    async def _fetch_page(self, url: str, semaphore: asyncio.Semaphore) -> List[Dict[str, Any]]:
+        """
+        Fetches a single page under the shared semaphore, honoring GitHub's
+        Retry-After back-off when the rate limit is hit.
+        """
+        async with semaphore:
+            response = await self._get(url)
+            if response is not None and response.status_code == 403:
+                retry_after = response.headers.get("Retry-After")
+                if retry_after:
+                    logger.warning(f"Rate limited on {url}, retrying after {retry_after}s.")
+                    await asyncio.sleep(float(retry_after))
+                    response = await self._get(url)
+            if not response or response.status_code != 200:
+                logger.error(f"Failed to fetch data from {url}. Status: {response.status_code if response else 'N/A'}")
+                return []
+            return response.json()
+
+    async def iter_pages(self, url: str) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Yields one page of results at a time for a paginated endpoint.
+
+        The first request reveals the total page count via the Link header;
+        the remaining pages are fetched in bounded concurrent waves and
+        yielded as they complete, so callers can stream each page without
+        buffering the full result set.
+
+        Args:
+            url: The initial URL to fetch.
+
+        Yields:
+            The list of items on each page, in page order.
+        """
+        response = await self._get(url)
+        if not response or response.status_code != 200:
+            logger.error(f"Failed to fetch data from {url}. Status: {response.status_code if response else 'N/A'}")
+            return
+
+        yield list(response.json())
+
+        last_url = response.links.get("last", {}).get("url")
+        if not last_url:
+            return
+
+        last_page = int(parse_qs(urlparse(last_url).query).get("page", ["1"])[0])
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_PAGE_REQUESTS)
+        wave_size = self.MAX_CONCURRENT_PAGE_REQUESTS
+        for wave_start in range(2, last_page + 1, wave_size):
+            pages = await asyncio.gather(
+                *(
+                    self._fetch_page(self._url_for_page(url, page), semaphore)
+                    for page in range(wave_start, min(wave_start + wave_size, last_page + 1))
+                )
+            )
+            for page_items in pages:
+                if page_items:
+                    yield page_items
+
     async def get_paginated_results(self, url: str) -> List[Dict[str, Any]]:
         """
         Fetches all pages for a given GitHub API endpoint.
@@ -39,17 +163,9 @@ class GitHubClient(BaseClient):
         Returns:
             A list containing all items from all pages.
         """
-        all_results = []
-        while url:
-            response = await self.execute_http_get_request(url=url)
-            if not response or response.status_code != 200:
-                logger.error(f"Failed to fetch data from {url}. Status: {response.status_code if response else 'N/A'}")
-                break
-            
-            all_results.extend(response.json())
-            
-            # Check for the 'next' link in the Link header for pagination
-            url = response.links.get("next", {}).get("url")
+        all_results: List[Dict[str, Any]] = []
+        async for page_items in self.iter_pages(url):
+            all_results.extend(page_items)
         return all_results
 
     async def get_repositories(self, owner: str) -> List[Dict[str, Any]]:
@@ -62,7 +178,9 @@ class GitHubClient(BaseClient):
         Returns:
             A list of repositories.
         """
-        url = f"{self.BASE_URL}/users/{owner}/repos"
+        # GitHub defaults to 30 items per page; asking for the maximum cuts
+        # the page count (and round-trips) by more than 3x.
+        url = f"{self.BASE_URL}/users/{owner}/repos?per_page=100"
         return await self.get_paginated_results(url)
 
     async def test_authentication(self) -> bool:
@@ -72,8 +190,20 @@ class GitHubClient(BaseClient):
         Returns:
             True if authentication is successful, False otherwise.
         """
-        response = await self.execute_http_get_request(f"{self.BASE_URL}/user")
-        return response is not None and response.status_code == 200
+        if (
+            self._auth_cache is not None
+            and time.monotonic() - self._auth_cache[0] < self.CHECK_CACHE_TTL_SECONDS
+        ):
+            return self._auth_cache[1]
+
+        response = await self._get(f"{self.BASE_URL}/user")
+        if response is None:
+            # Transport error: report failure but leave the cache alone so a
+            # transient blip is not remembered as a bad token for the TTL.
+            return False
+        is_authenticated = response.status_code == 200
+        self._auth_cache = (time.monotonic(), is_authenticated)
+        return is_authenticated
 
     async def check_owner_exists(self, owner: str) -> bool:
         """
@@ -85,6 +215,16 @@ class GitHubClient(BaseClient):
         Returns:
             True if the owner exists, False otherwise.
         """
-        response = await self.execute_http_get_request(f"{self.BASE_URL}/users/{owner}")
-        return response is not None and response.status_code == 200
+        cached = self._owner_cache.get(owner)
+        if cached is not None and time.monotonic() - cached[0] < self.CHECK_CACHE_TTL_SECONDS:
+            return cached[1]
+
+        response = await self._get(f"{self.BASE_URL}/users/{owner}")
+        if response is None:
+            # Transport error: don't memoize, so the next preflight retry
+            # probes again instead of seeing a cached "not found".
+            return False
+        owner_exists = response.status_code == 200
+        self._owner_cache[owner] = (time.monotonic(), owner_exists)
+        return owner_exists
 
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, List
 
 from application_sdk.handlers.base import BaseHandler
 from application_sdk.observability.logger_adaptor import get_logger
@@ -65,12 +65,24 @@ class GitHubHandler(BaseHandler):
         logger.info("Preflight check successful.")
         return {"status": "success", "message": f"Successfully connected and found owner '{owner}'."}
 
-    async def fetch_repositories_metadata(self, owner: str) -> List[Dict[str, Any]]:
+    async def iter_repository_pages(self, owner: str) -> AsyncIterator[List[Dict[str, Any]]]:
         """
-        Uses the client to get repositories and returns the raw metadata.
+        Streams pages of raw repository metadata for an owner as they arrive.
         """
         logger.info(f"Fetching repositories for owner: {owner}")
-        repos = await self.client.get_repositories(owner=owner)
+        url = f"{self.client.BASE_URL}/users/{owner}/repos?per_page=100"
+        async for page in self.client.iter_pages(url):
+            yield page
+
+    async def fetch_repositories_metadata(self, owner: str) -> List[Dict[str, Any]]:
+        """
+        Returns the full raw metadata list for an owner. Kept for callers
+        that need everything at once; the extraction activity streams
+        iter_repository_pages directly so it never builds this list.
+        """
+        repos: List[Dict[str, Any]] = []
+        async for page in self.iter_repository_pages(owner):
+            repos.extend(page)
         logger.info(f"Fetched {len(repos)} repositories.")
         return repos
 
@@ -1,11 +1,48 @@
+import re
+from enum import Enum
 from typing import Any, Dict, Optional, Type
 
+import daft
+from daft import col, lit
+
 from application_sdk.observability.logger_adaptor import get_logger
 from application_sdk.transformers.atlas import AtlasTransformer
 from application_sdk.transformers.common.utils import build_atlas_qualified_name
 
 logger = get_logger(__name__)
 
+# Precompiled once; substituting matches is a single pass over the string
+# versus the two full encode/decode allocations of the old codec round-trip.
+_NON_ASCII_RE = re.compile(r"[^\x00-\x7F]")
+
+
+def _clean_text(text: Any) -> Any:
+    """
+    Removes problematic non-ASCII characters from string values, leaving
+    other types untouched.
+    """
+    if isinstance(text, str):
+        return _NON_ASCII_RE.sub("", text)
+    return text
+
+
+def _strip_non_ascii(expr: daft.Expression) -> daft.Expression:
+    """
+    Drops non-ASCII characters from a string column expression, the
+    vectorized equivalent of the row-wise clean_text helper.
+    """
+    return expr.str.replace(r"[^\x00-\x7F]", "", regex=True)
+
+
+def _broadcast(value: Any) -> daft.Expression:
+    """
+    Returns a constant as a full-length column expression. daft 0.5's
+    struct kernel does not broadcast length-1 literal children (mixing
+    lit and col children panics on multi-row frames), so constants are
+    tied to an existing column via if_else, which does broadcast.
+    """
+    return col("id").is_null().if_else(lit(value), lit(value))
+
 
 class GitHubRepository:
     """
@@ -29,36 +66,27 @@ class GitHubRepository:
         """
         connection_qualified_name = obj.get("connection_qualified_name", "")
 
-        # Clean text fields to remove problematic Unicode characters
-        def clean_text(text):
-            if not text:
-                return text
-            if isinstance(text, str):
-                # Replace problematic Unicode characters with safe alternatives
-                return text.encode('ascii', 'ignore').decode('ascii')
-            return text
-
         # Attributes that map to the generic 'Resource' asset type in Atlan
         attributes = {
-            "name": clean_text(obj.get("name")),
+            "name": _clean_text(obj.get("name")),
             "qualifiedName": build_atlas_qualified_name(
                 connection_qualified_name, obj.get("full_name", "")
             ),
             "connectionQualifiedName": connection_qualified_name,
-            "description": clean_text(obj.get("description")),
+            "description": _clean_text(obj.get("description")),
             "sourceUrl": obj.get("html_url"),
         }
 
         # GitHub-specific fields that will be stored as custom metadata in Atlan
         custom_attributes = {
-            "github_owner": obj.get("owner", {}).get("login"),
+            "github_owner": obj.get("owner_login"),
             "github_is_private": obj.get("private", False),
             "github_is_fork": obj.get("fork", False),
             "github_stargazers_count": obj.get("stargazers_count", 0),
             "github_watchers_count": obj.get("watchers_count", 0),
             "github_forks_count": obj.get("forks_count", 0),
             "github_open_issues_count": obj.get("open_issues_count", 0),
-            "github_language": clean_text(obj.get("language")),
+            "github_language": _clean_text(obj.get("language")),
         }
 
         return {
@@ -80,8 +108,91 @@ class GitHubTransformer(AtlasTransformer):
 
         # Register our custom GitHubRepository helper for the "REPOSITORY" typename.
         self.entity_class_definitions = {"REPOSITORY": GitHubRepository}
+        # Resolved once here so the per-row fallback path skips the dict
+        # lookup for the only typename this connector produces.
+        self._repository_typename = "REPOSITORY"
+        self._repository_creator = GitHubRepository
         # We set the connector_type to a generic value since 'github' is not a native Atlan type.
-        self.connector_type = "api" 
+        self.connector_type = "api"
+
+    def transform_metadata(
+        self,
+        typename: str,
+        dataframe: daft.DataFrame,
+        workflow_id: str,
+        workflow_run_id: str,
+        **kwargs: Any,
+    ) -> Optional[daft.DataFrame]:
+        """
+        Vectorized transformation for the REPOSITORY path: entities are
+        assembled with Daft column expressions, so the whole dataframe is
+        transformed as Arrow kernel passes instead of one transform_row call
+        per repository. Other typenames fall back to the SDK's row-wise
+        implementation.
+        """
+        if typename.upper() != "REPOSITORY":
+            return super().transform_metadata(
+                typename=typename,
+                dataframe=dataframe,
+                workflow_id=workflow_id,
+                workflow_run_id=workflow_run_id,
+                **kwargs,
+            )
+
+        connection = kwargs.get("connection") or {}
+        connection_name = connection.get("connection_name") or "github-default"
+        connection_qualified_name = (
+            connection.get("connection_qualified_name") or "default/github/connection"
+        )
+
+        # The sync-lineage metadata the row path merges in via
+        # _enrich_entity_with_metadata (tenant_id, last_sync_*, connection/
+        # connector names) is identical for every row, so compute it once
+        # through the same SDK helper and join it as literal columns.
+        # Enum values (EntityStatus) are unwrapped for Arrow.
+        enriched = self._enrich_entity_with_metadata(
+            workflow_id,
+            workflow_run_id,
+            {
+                "connection_name": connection_name,
+                "connection_qualified_name": connection_qualified_name,
+            },
+        )
+        metadata_columns = [
+            _broadcast(value.value if isinstance(value, Enum) else value).alias(name)
+            for name, value in enriched["attributes"].items()
+        ]
+
+        attributes = daft.struct(
+            _strip_non_ascii(col("name")).alias("name"),
+            (
+                lit(f"{connection_qualified_name}/") + col("full_name").fill_null("")
+            ).alias("qualifiedName"),
+            _broadcast(connection_qualified_name).alias("connectionQualifiedName"),
+            _strip_non_ascii(col("description")).alias("description"),
+            col("html_url").alias("sourceUrl"),
+            *metadata_columns,
+        ).alias("attributes")
+
+        # fill_null mirrors the row path's obj.get(..., False/0) defaults,
+        # which JsonOutput's null-stripping would otherwise erase.
+        custom_attributes = daft.struct(
+            col("owner_login").alias("github_owner"),
+            col("private").fill_null(False).alias("github_is_private"),
+            col("fork").fill_null(False).alias("github_is_fork"),
+            col("stargazers_count").fill_null(0).alias("github_stargazers_count"),
+            col("watchers_count").fill_null(0).alias("github_watchers_count"),
+            col("forks_count").fill_null(0).alias("github_forks_count"),
+            col("open_issues_count").fill_null(0).alias("github_open_issues_count"),
+            _strip_non_ascii(col("language")).alias("github_language"),
+        ).alias("customAttributes")
+
+        return dataframe.select(
+            lit("Resource").alias("typeName"),
+            attributes,
+            custom_attributes,
+            lit("ACTIVE").alias("status"),
+        )
 
     def transform_row(
         self,
@@ -118,7 +229,10 @@ class GitHubTransformer(AtlasTransformer):
             }
         )
 
-        creator = self.entity_class_definitions.get(typename)
+        if typename == self._repository_typename:
+            creator = self._repository_creator
+        else:
+            creator = self.entity_class_definitions.get(typename)
         if creator:
             try:
                 entity_attributes = creator.get_attributes(data)
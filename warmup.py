@@ -0,0 +1,13 @@
+"""
+Build-time warmup for the container image.
+
+Importing main (and, through app.activities, the full connector import
+tree) here populates __pycache__ with compiled bytecode, so runtime cold
+starts skip the .py -> .pyc compile for the whole transitive import set.
+main.py's __main__ guard means nothing is executed beyond module bodies;
+WARMUP_MODE is set by the Dockerfile as a belt-and-braces signal should
+any module want to skip side effects during warmup.
+"""
+
+import main  # noqa: F401
+import app.activities  # noqa: F401